@@ -1,10 +1,26 @@
-import re
-from typing import Any, Optional, Tuple
+import math
+import os
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 from tinydb import Query
 from tinydb_tool.shared.db_utils import load_database
-from tinydb_tool.shared.formatting import print_documents
+from tinydb_tool.shared.formatting import print_documents_stream
 from tinydb_tool.shared.error import handle_error
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+# Root query used to create field queries. Indexing a Query returns a new query
+# object, so a single shared instance is safe to reuse.
+_Q = Query()
+
+# Support ==, !=, >, <, >=, <= operators
+_OPERATORS = ('==', '!=', '>=', '<=', '>', '<')
+
 
 def parse_query_string(string_to_query: str) -> Optional[Tuple[str, str, Any]]:
     """
@@ -20,59 +36,168 @@ def parse_query_string(string_to_query: str) -> Optional[Tuple[str, str, Any]]:
         - operator: The comparison operator ('==', '!=', '>', '<', '>=', or '<=')
         - value: The value to compare against (string or numeric)
     """
-    if not string_to_query or not isinstance(string_to_query, str):
+    try:
+        return _split_query(string_to_query)
+    except ValueError:
         return None
+
+
+def _split_query(string_to_query: str) -> Tuple[str, str, Any]:
+    """
+    Split a query string into its components, reporting why an invalid one fails.
     
-    string_to_query = string_to_query.strip()
+    Args:
+        string_to_query: Query string in the format "field == value", "field != value",
+                        "field > value", "field < value", "field >= value", or "field <= value".
+        
+    Returns:
+        A tuple of (field_name, operator, value), as returned by parse_query_string.
+        The value is not converted to a number.
+        
+    Raises:
+        ValueError: If the query string is invalid or empty.
+    """
+    return _split_stripped_query(_strip_query_string(string_to_query))
+
+
+def _strip_query_string(string_to_query: str) -> str:
+    """
+    Check that a query string is a non-empty string and strip it.
     
+    Args:
+        string_to_query: The query string as given by the caller.
+        
+    Returns:
+        The query string without surrounding whitespace.
+        
+    Raises:
+        ValueError: If the query string is not a string, or is empty or whitespace only.
+    """
+    if not string_to_query or not isinstance(string_to_query, str):
+        raise ValueError("Query string cannot be empty or non-string")
+    
+    string_to_query = string_to_query.strip()
     if not string_to_query:
-        return None
+        raise ValueError("Query string cannot be empty or whitespace only")
+    
+    return string_to_query
+
+
+def _split_stripped_query(string_to_query: str) -> Tuple[str, str, Any]:
+    """
+    Split a query string already checked by _strip_query_string, as _split_query does.
     
-    # Support ==, !=, >, <, >=, <= operators
-    pattern = r'^(\w+)\s*(==|!=|>=|<=|>|<)\s*(.+)$'
-    match = re.match(pattern, string_to_query)
+    Args:
+        string_to_query: The stripped, non-empty query string.
+        
+    Returns:
+        A tuple of (field_name, operator, value), as returned by _split_query.
+        
+    Raises:
+        ValueError: If the query string is not well-formed.
+    """
+    scanned = _scan_query_string(string_to_query)
+    if scanned is None:
+        raise ValueError(
+            f"Invalid query format: '{string_to_query}'. "
+            f"Expected format: 'field == value', 'field != value', 'field > value', "
+            f"'field < value', 'field >= value', or 'field <= value'. "
+            f"Field names must be alphanumeric (letters, numbers, underscore)."
+        )
     
-    if not match:
-        return None
+    field_name, operator, value_string = scanned
+    return field_name, operator, parse_value(value_string)
+
+
+def _scan_query_string(string_to_query: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split a stripped, non-empty query string into its raw components in a single pass.
     
-    field_name = match.group(1)
-    operator = match.group(2)
-    value_string = match.group(3).strip()
+    Args:
+        string_to_query: The stripped query string.
+        
+    Returns:
+        A tuple of (field_name, operator, value_string) if the query is well-formed,
+        None otherwise. The value string is stripped but still quoted.
+    """
+    length = len(string_to_query)
     
-    if not field_name or not operator or not value_string:
+    # Field name: one or more word characters (letters, digits, underscore)
+    index = 0
+    while index < length and (string_to_query[index].isalnum() or string_to_query[index] == '_'):
+        index += 1
+    # Interned, as the field name is used for a dict lookup on every document
+    field_name = sys.intern(string_to_query[:index])
+    
+    while index < length and string_to_query[index].isspace():
+        index += 1
+    
+    # Operator: two-character operators take precedence over '>' and '<', but
+    # fall back to the single character when nothing would be left for the value
+    # (e.g. "field >=" is "field" > "=")
+    value_string = ''
+    operator = ''
+    for candidate in (string_to_query[index:index + 2], string_to_query[index:index + 1]):
+        if candidate not in _OPERATORS:
+            continue
+        operator = candidate
+        value_string = string_to_query[index + len(operator):].strip()
+        if value_string:
+            break
+    
+    # The value is the remainder of the query string and must fit on one line
+    if '\n' in value_string:
         return None
     
-    value = parse_value(value_string)
+    if not field_name or not operator or not value_string:
+        return None
     
-    return field_name, operator, value
+    return field_name, operator, value_string
 
 
 def parse_value(value_string: str) -> Any:
     """
     Parse a value string, removing quotes if present.
     
+    The value string must already be stripped of surrounding whitespace, as done
+    by the query parser. Use parse_value_raw for unstripped input.
+    
     Args:
-        value_string: The value string, optionally quoted with single or double quotes.
+        value_string: The stripped value string, optionally quoted with single or
+                      double quotes.
         
     Returns:
         The parsed value. If the string is quoted, returns the unquoted string.
         Otherwise, returns the string as-is (which may represent a number).
     """
-    value_string = value_string.strip()
-    
-    if (value_string.startswith('"') and value_string.endswith('"')) or \
-       (value_string.startswith("'") and value_string.endswith("'")):
+    if value_string and value_string[0] in ('"', "'") and value_string[0] == value_string[-1]:
         return value_string[1:-1]
 
     return value_string
 
 
-def parse_numeric_value(value: Any) -> float:
+def parse_value_raw(value_string: str) -> Any:
+    """
+    Parse a value string that may have surrounding whitespace, removing quotes if present.
+    
+    Args:
+        value_string: The value string, optionally quoted with single or double quotes.
+        
+    Returns:
+        The parsed value, as returned by parse_value.
+    """
+    return parse_value(value_string.strip())
+
+
+def parse_numeric_value(value: Any, allow_expressions: bool = False) -> float:
     """
     Parse a value as a numeric type (int or float).
     
     Args:
         value: Value to parse (can be int, float, or string representation).
+        allow_expressions: If True, strings that are not plain numbers are evaluated
+                           as math expressions (e.g. "math.pi"). Only meant for the
+                           query value, which is parsed once when building the query.
         
     Returns:
         Float representation of the numeric value.
@@ -88,23 +213,39 @@ def parse_numeric_value(value: Any) -> float:
         try:
             return float(value)
         except ValueError:
-            try:
-                import math
-                safe_namespace = {
-                    'math': math,
-                    '__builtins__': {}
-                }
-                result = eval(value, safe_namespace)
-                if isinstance(result, (int, float)):
-                    return float(result)
-                else:
-                    raise ValueError("")
-            except:
-                raise ValueError(f"Cannot parse as numeric value: {value}")
+            if allow_expressions:
+                return _evaluate_numeric_expression(value)
     
     raise ValueError(f"Cannot parse as numeric value: {value}")
 
 
+def _evaluate_numeric_expression(expression: str) -> float:
+    """
+    Evaluate a math expression such as "math.pi" or "2 * 3" as a number.
+    
+    Args:
+        expression: The expression string. Only the math module is available.
+        
+    Returns:
+        Float result of the expression.
+        
+    Raises:
+        ValueError: If the expression is invalid or does not evaluate to a number.
+    """
+    try:
+        safe_namespace = {
+            'math': math,
+            '__builtins__': {}
+        }
+        result = eval(expression, safe_namespace)
+        if isinstance(result, (int, float)):
+            return float(result)
+        else:
+            raise ValueError("")
+    except:
+        raise ValueError(f"Cannot parse as numeric value: {expression}")
+
+
 def is_numeric_value(value: Any) -> bool:
     """
     Check if a value can be parsed as a number.
@@ -115,11 +256,116 @@ def is_numeric_value(value: Any) -> bool:
     Returns:
         True if the value can be parsed as a number, False otherwise.
     """
-    try:
-        parse_numeric_value(value)
+    # JSON numbers: no exception handling needed
+    value_type = type(value)
+    if value_type is int or value_type is float:
         return True
-    except (ValueError, TypeError):
+    
+    if isinstance(value, (int, float)):
+        return True
+    
+    if isinstance(value, str):
+        try:
+            float(value)
+            return True
+        except ValueError:
+            return False
+    
+    return False
+
+
+# Operators that compare numerically. JSON numbers are compared directly, other
+# document values are converted with float() and never match if that fails.
+_NUMERIC_OPS = frozenset({'>', '>=', '<', '<='})
+
+# Source of a generated numeric test function, with the operator inlined. The
+# target is inlined as a constant when it is an int or a finite float, or named
+# "target" otherwise.
+_NUMERIC_TEST_TEMPLATE = """\
+def test(value):
+    value_type = type(value)
+    if value_type is int or value_type is float:
+        return value {operator} {target}
+    try:
+        return float(value) {operator} {target}
+    except (TypeError, ValueError, OverflowError):
         return False
+"""
+
+
+@lru_cache(maxsize=256)
+def _compile_numeric_test(operator: str, target: float) -> Callable[[Any], bool]:
+    """
+    Generate a test function comparing a document value against a numeric target.
+    
+    The generated function has the operator and target compiled in, avoiding
+    closure lookups for every tested document.
+    
+    Args:
+        operator: The numeric comparison operator ('>', '>=', '<', or '<=').
+        target: The numeric value to compare against. Integers are compared
+                exactly, also beyond +/- 2**53.
+        
+    Returns:
+        The test function. Document values that cannot be converted to a number
+        never match.
+    """
+    if operator not in _NUMERIC_OPS:
+        raise ValueError(f"Unsupported operator: {operator}")
+    
+    # inf and nan have no literal representation, so they are looked up from
+    # the function's globals instead
+    namespace: Dict[str, Any] = {'target': target}
+    if isinstance(target, int) or math.isfinite(target):
+        target_source = repr(target)
+    else:
+        target_source = 'target'
+    exec(_NUMERIC_TEST_TEMPLATE.format(operator=operator, target=target_source), namespace)
+    return namespace['test']
+
+
+# Query condition builders for each supported operator, called with the TinyDB
+# field and the comparison value.
+_OP_BUILDERS = {
+    '>': lambda field, value: field.test(_compile_numeric_test('>', value)),
+    '>=': lambda field, value: field.test(_compile_numeric_test('>=', value)),
+    '<': lambda field, value: field.test(_compile_numeric_test('<', value)),
+    '<=': lambda field, value: field.test(_compile_numeric_test('<=', value)),
+    '==': lambda field, value: field == value,
+    '!=': lambda field, value: field != value,
+}
+
+
+def _coerce_query_value(operator: str, value: Any) -> Any:
+    """
+    Convert the value of a query to the type its operator compares against.
+    
+    Args:
+        operator: The comparison operator ('==', '!=', '>', '<', '>=', or '<=').
+        value: The parsed value of the query.
+        
+    Returns:
+        For the numeric operators (>, >=, <, <=), the value as an int if it is an
+        integer literal, so that large integers are compared exactly, or else as
+        a float, evaluating math expressions such as "math.pi". Otherwise the
+        value unchanged.
+        
+    Raises:
+        ValueError: If a numeric operator is used with a non-numeric value.
+    """
+    if operator not in _NUMERIC_OPS:
+        return value
+    
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    
+    try:
+        return parse_numeric_value(value, allow_expressions=True)
+    except ValueError as e:
+        raise ValueError(f"Numeric comparison operators (>, >=, <, <=) require numeric values. {str(e)}")
 
 
 def build_tinydb_query(field_name: str, operator: str, value: Any) -> Any:
@@ -138,32 +384,12 @@ def build_tinydb_query(field_name: str, operator: str, value: Any) -> Any:
         ValueError: If the operator is not supported, or if numeric operators are used
                    with non-numeric values.
     """
-    Q = Query()
-    field = Q[field_name]
-    
-    # Handle numeric comparison operators (>, >=, <, <=)
-    if operator in ('>', '>=', '<', '<='):
-        try:
-            numeric_value = parse_numeric_value(value)
-        except ValueError as e:
-            raise ValueError(f"Numeric comparison operators (>, >=, <, <=) require numeric values. {str(e)}")
-        
-        if operator == '>':
-            return field.test(lambda x: is_numeric_value(x) and parse_numeric_value(x) > numeric_value)
-        elif operator == '>=':
-            return field.test(lambda x: is_numeric_value(x) and parse_numeric_value(x) >= numeric_value)
-        elif operator == '<':
-            return field.test(lambda x: is_numeric_value(x) and parse_numeric_value(x) < numeric_value)
-        elif operator == '<=':
-            return field.test(lambda x: is_numeric_value(x) and parse_numeric_value(x) <= numeric_value)
-    
-    # Handle equality operators (==, !=)
-    if operator == '==':
-        return field == value
-    elif operator == '!=':
-        return field != value
-    else:
+    try:
+        builder = _OP_BUILDERS[operator]
+    except KeyError:
         raise ValueError(f"Unsupported operator: {operator}")
+    
+    return builder(_Q[field_name], _coerce_query_value(operator, value))
 
 
 def parse_and_build_query(string_to_query: str) -> Any:
@@ -171,6 +397,8 @@ def parse_and_build_query(string_to_query: str) -> Any:
     Parse a query string and build a TinyDB query condition.
     
     This function is designed to be reused by other commands (e.g., delete, update).
+    Built query conditions are immutable, so the condition of a query string is
+    cached and the same instance is returned when it is parsed again.
     
     Args:
         string_to_query: Query string in the format "field == value", "field != value",
@@ -183,24 +411,334 @@ def parse_and_build_query(string_to_query: str) -> Any:
         ValueError: If the query string is invalid, empty, or operator is unsupported.
                     The error message will provide details about what went wrong.
     """
-    if not string_to_query or not isinstance(string_to_query, str):
-        raise ValueError("Query string cannot be empty or non-string")
+    return _parse_and_build_query_cached(_strip_query_string(string_to_query))
+
+
+@lru_cache(maxsize=256)
+def _parse_and_build_query_cached(string_to_query: str) -> Any:
+    """
+    Cached implementation of parse_and_build_query, called with the stripped
+    query string. Invalid queries raise ValueError and are not cached.
+    """
+    return build_tinydb_query(*_split_stripped_query(string_to_query))
+
+
+def _parse_query(string_to_query: str) -> Tuple[str, str, Any]:
+    """
+    Parse and validate a query string without building a query condition.
     
-    string_to_query = string_to_query.strip()
-    if not string_to_query:
-        raise ValueError("Query string cannot be empty or whitespace only")
+    Args:
+        string_to_query: Query string in the format "field == value", "field != value",
+                        "field > value", "field < value", "field >= value", or "field <= value"
+        
+    Returns:
+        A tuple of (field_name, operator, value). For the numeric operators (>, >=,
+        <, <=) the value is already parsed as a number, as by _coerce_query_value.
+        
+    Raises:
+        ValueError: If the query string is invalid or empty, or if a numeric operator
+                    is used with a non-numeric value.
+    """
+    field_name, operator, value = _split_query(string_to_query)
+    return field_name, operator, _coerce_query_value(operator, value)
+
+
+def _iter_field_matches(
+    documents: Iterable[Dict[str, Any]], field_name: str, test: Callable[[Any], bool]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the documents whose field value passes a test.
     
-    parsed = parse_query_string(string_to_query)
-    if parsed is None:
-        raise ValueError(
-            f"Invalid query format: '{string_to_query}'. "
-            f"Expected format: 'field == value', 'field != value', 'field > value', "
-            f"'field < value', 'field >= value', or 'field <= value'. "
-            f"Field names must be alphanumeric (letters, numbers, underscore)."
-        )
+    This tests the field value directly instead of going through a TinyDB query
+    condition, and produces matches one at a time instead of collecting them
+    into a list like db.search. Documents without the field never match.
+    
+    Args:
+        documents: The documents to test, such as a TinyDB database instance.
+        field_name: The field to test.
+        test: Function called with the field value, returning True on a match.
+        
+    Yields:
+        Each matching document.
+    """
+    for document in documents:
+        try:
+            field_value = document[field_name]
+        except KeyError:
+            continue
+        if test(field_value):
+            yield document
+
+
+# Key of a handle's documents in its index dict. The indexes refer to these
+# documents instead of each reading its own copy from the database.
+_DOCUMENTS_KEY = ('documents', '')
+
+
+def _get_documents(db: Any, indexes: Dict[Tuple[str, str], Any]) -> List[Dict[str, Any]]:
+    """
+    Get the documents of a database handle, reading them on first use.
+    
+    Args:
+        db: The TinyDB database instance.
+        indexes: The indexes of the database handle, as returned by _get_cached_db.
+        
+    Returns:
+        The documents in database order, shared by all indexes of the handle.
+    """
+    documents = indexes.get(_DOCUMENTS_KEY)
+    if documents is None:
+        documents = indexes[_DOCUMENTS_KEY] = db.all()
+    return documents
+
+
+def _get_eq_index(db: Any, indexes: Dict[Tuple[str, str], Any], field_name: str) -> Dict[Any, List[Dict[str, Any]]]:
+    """
+    Get the equality index of a field, building it on first use.
+    
+    Args:
+        db: The TinyDB database instance.
+        indexes: The indexes of the database handle, as returned by _get_cached_db.
+        field_name: The field to index.
+        
+    Returns:
+        A dict mapping each (hashable) field value to the matching documents.
+        Documents without the field are not indexed.
+    """
+    key = ('==', field_name)
+    index = indexes.get(key)
+    if index is None:
+        index = {}
+        for document in _get_documents(db, indexes):
+            try:
+                index.setdefault(document[field_name], []).append(document)
+            except (KeyError, TypeError):
+                # Missing field, or an unhashable value (list/dict) that can
+                # never equal a parsed query value
+                continue
+        indexes[key] = index
+    return index
+
+
+def _to_float(value: Any) -> float:
+    """
+    Convert a document value to a float for the sorted numeric index.
     
-    field_name, operator, value = parsed
-    return build_tinydb_query(field_name, operator, value)
+    Args:
+        value: The document value. Integers beyond +/- 2**53 are not passed here,
+               as a float cannot hold them exactly.
+        
+    Returns:
+        The value as a float, or NaN if it cannot be converted (such values never
+        match and are left out of the index).
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+# Largest integer magnitude a float64 represents exactly. Larger integers are
+# kept out of the sorted index and compared exactly instead.
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+def _can_binary_search(target: float) -> bool:
+    """
+    Check whether a numeric target can be looked up in a sorted numeric index.
+    
+    Args:
+        target: The numeric value to compare against.
+        
+    Returns:
+        False for NaN, which matches nothing but has no place in the sort order,
+        and for integers beyond +/- 2**53, which would be rounded when compared
+        against the index. True otherwise.
+    """
+    if isinstance(target, int):
+        return abs(target) <= _MAX_EXACT_FLOAT_INT
+    return not math.isnan(target)
+
+# searchsorted side giving the boundary between non-matching and matching values
+_SEARCHSORTED_SIDES: Dict[str, Literal['left', 'right']] = {
+    '>': 'right',
+    '>=': 'left',
+    '<': 'left',
+    '<=': 'right',
+}
+
+
+def _get_sorted_index(
+    db: Any, indexes: Dict[Tuple[str, str], Any], field_name: str
+) -> Tuple[Any, Any, List[int], List[Dict[str, Any]]]:
+    """
+    Get the sorted numeric index of a field, building it on first use.
+    
+    Args:
+        db: The TinyDB database instance.
+        indexes: The indexes of the database handle, as returned by _get_cached_db.
+        field_name: The field to index.
+        
+    Returns:
+        A tuple of (sorted_values, sorted_positions, exact_positions, documents):
+        the field's numeric values in ascending order, the position of the
+        document of each value, and the handle's shared documents in database
+        order. Documents whose value cannot be converted to a number are not
+        indexed.
+        exact_positions lists the documents holding integers beyond +/- 2**53,
+        which are not indexed either and must be compared exactly.
+    """
+    key = ('sorted', field_name)
+    index = indexes.get(key)
+    if index is None:
+        documents = _get_documents(db, indexes)
+        values = np.empty(len(documents), dtype=np.float64)
+        exact_positions = []
+        for position, document in enumerate(documents):
+            value = document.get(field_name)
+            if isinstance(value, int) and abs(value) > _MAX_EXACT_FLOAT_INT:
+                exact_positions.append(position)
+                values[position] = math.nan
+            else:
+                values[position] = _to_float(value)
+        positions = np.flatnonzero(~np.isnan(values))
+        sorted_positions = positions[np.argsort(values[positions], kind='stable')]
+        index = (values[sorted_positions], sorted_positions, exact_positions, documents)
+        indexes[key] = index
+    return index
+
+
+def _numpy_numeric_matches(
+    db: Any, indexes: Dict[Tuple[str, str], Any], field_name: str, operator: str, target: float
+) -> Iterator[Dict[str, Any]]:
+    """
+    Find the documents matching a numeric comparison using a sorted index.
+    
+    The field's sorted index is built once per database handle, after which each
+    comparison is a binary search for the boundary between non-matching and
+    matching values. Integers too large for a float are tested individually, so
+    the result is the same as comparing every document exactly.
+    
+    Args:
+        db: The TinyDB database instance.
+        indexes: The indexes of the database handle, as returned by _get_cached_db.
+        field_name: The field to compare.
+        operator: The numeric comparison operator ('>', '>=', '<', or '<=').
+        target: The numeric value to compare against. _can_binary_search must
+                be True for it.
+        
+    Returns:
+        An iterator over the matching documents, in database order.
+    """
+    sorted_values, sorted_positions, exact_positions, documents = _get_sorted_index(db, indexes, field_name)
+    boundary = np.searchsorted(sorted_values, target, side=_SEARCHSORTED_SIDES[operator])
+    if operator in ('>', '>='):
+        positions = sorted_positions[boundary:]
+    else:
+        positions = sorted_positions[:boundary]
+    
+    if exact_positions:
+        test = _compile_numeric_test(operator, target)
+        exact_matches = [
+            position for position in exact_positions
+            if test(documents[position][field_name])
+        ]
+        positions = np.concatenate((positions, np.array(exact_matches, dtype=np.int64)))
+    
+    return (documents[i] for i in np.sort(positions))
+
+
+# Maximum number of database handles kept open by the handle cache
+_DB_CACHE_SIZE = 8
+
+# Database handles reused across queries, keyed by absolute file path, in least
+# recently used order. Each entry holds the file's (mtime, size) signature when
+# it was loaded, the handle, and the equality and sorted indexes built for it,
+# keyed by ('==' or 'sorted', field_name), along with the documents they share
+# under _DOCUMENTS_KEY. The indexes go with the handle.
+_db_cache: "OrderedDict[str, Tuple[Optional[Tuple[int, int]], Any, Dict[Tuple[str, str], Any]]]" = OrderedDict()
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Get the (mtime, size) signature of a file, or None if it cannot be accessed.
+    
+    Args:
+        path: Path to the file.
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _get_cached_db(file_path: str) -> Tuple[Any, Dict[Tuple[str, str], Any]]:
+    """
+    Get a database handle for a file, reusing the handle from a previous query.
+    
+    The cached handle keeps the parsed file in memory and is reused as long as the
+    file's modification time and size are unchanged. A changed file evicts and
+    closes the old handle (dropping its indexes) and loads it again. Writes that
+    keep the size and land within the file system's timestamp resolution are not
+    detected. At most _DB_CACHE_SIZE handles are kept; loading another one evicts
+    the least recently used handle.
+    
+    Args:
+        file_path: Path to the TinyDB JSON database file.
+        
+    Returns:
+        A tuple of (db, indexes): the TinyDB database instance, and the dict
+        holding the indexes built for it. The database must not be closed by the
+        caller; use _evict_cached_db instead.
+        
+    Raises:
+        FileNotFoundError, PermissionError, ValueError, OSError: As raised by
+        load_database.
+    """
+    indexes: Dict[Tuple[str, str], Any]
+    path = os.path.abspath(file_path)
+    cached = _db_cache.get(path)
+    if cached is not None:
+        signature, db, indexes = cached
+        if signature is not None and _file_signature(path) == signature:
+            _db_cache.move_to_end(path)
+            return db, indexes
+        _evict_cached_db(path)
+    
+    db = load_database(file_path, caching=True)
+    indexes = {}
+    # Taken before the first read, so a change made in between is detected by
+    # the next query
+    _db_cache[path] = (_file_signature(path), db, indexes)
+    
+    while len(_db_cache) > _DB_CACHE_SIZE:
+        _evict_cached_db(next(iter(_db_cache)))
+    
+    return db, indexes
+
+
+def _evict_cached_db(file_path: str) -> None:
+    """
+    Remove a database handle and its indexes from the cache and close it.
+    
+    Args:
+        file_path: Path to the TinyDB JSON database file.
+    """
+    cached = _db_cache.pop(os.path.abspath(file_path), None)
+    if cached is not None:
+        cached[1].close()
+
+
+def close_cached_databases() -> None:
+    """
+    Close all database handles kept open by previous queries.
+    
+    Library callers that run queries in a long-lived process can call this to
+    release the open files, parsed data and indexes held by the handle cache.
+    """
+    for path in list(_db_cache):
+        _evict_cached_db(path)
 
 
 def execute_query_command(file_path: str, string_to_query: str, pretty: bool = True) -> int:
@@ -217,32 +755,49 @@ def execute_query_command(file_path: str, string_to_query: str, pretty: bool = T
         Exit code: 0 for success, 1 for error.
     """
     try:
-        # Parse and build query condition
+        # Parse and validate the query. The CLI tests field values directly, so
+        # no TinyDB query condition is built.
         try:
-            query_condition = parse_and_build_query(string_to_query)
+            field_name, operator, value = _parse_query(string_to_query)
         except ValueError as e:
             handle_error(str(e))
             return 1
         
-        # Load database
+        # Load database, reusing the handle of a previous query on this file
         try:
-            db = load_database(file_path)
+            db, indexes = _get_cached_db(file_path)
         except (FileNotFoundError, PermissionError, ValueError) as e:
             # Errors are already handled in load_database
             return 1
         
-        # Search for matching documents
+        # Search for matching documents and print them as they are found.
+        # Equality queries are answered from the field's equality index, and
+        # numeric comparisons from its sorted index when NumPy is available.
+        # If the search fails midway, the JSON list printed so far is left
+        # unterminated on stdout, so it does not parse as a complete result.
+        matching_documents: Iterable[Dict[str, Any]]
         try:
-            matching_documents = db.search(query_condition)
+            if operator == '==':
+                matching_documents = _get_eq_index(db, indexes, field_name).get(value, [])
+            elif operator in _NUMERIC_OPS:
+                # NaN and integer targets too large for a float use the
+                # per-document scan
+                if np is not None and _can_binary_search(value):
+                    matching_documents = _numpy_numeric_matches(db, indexes, field_name, operator, value)
+                else:
+                    matching_documents = _iter_field_matches(
+                        _get_documents(db, indexes), field_name, _compile_numeric_test(operator, value)
+                    )
+            else:
+                matching_documents = _iter_field_matches(
+                    _get_documents(db, indexes), field_name, lambda field_value: field_value != value
+                )
+            print_documents_stream(matching_documents, pretty)
         except Exception as e:
             handle_error(f"Failed to search database: {str(e)}")
-            db.close()
+            _evict_cached_db(file_path)
             return 1
         
-        # Print matching documents
-        print_documents(matching_documents, pretty)
-        
-        db.close()
         return 0
         
     except Exception as e:
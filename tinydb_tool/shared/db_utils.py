@@ -8,6 +8,7 @@ It handles database file operations and provides a unified interface for databas
 import os
 from typing import TYPE_CHECKING
 from tinydb import TinyDB
+from tinydb.middlewares import CachingMiddleware
 from tinydb.storages import JSONStorage
 from tinydb_tool.shared.error import handle_error
 
@@ -15,7 +16,7 @@ if TYPE_CHECKING:
     from tinydb import TinyDB as TinyDBType
 
 
-def load_database(path: str) -> "TinyDBType":
+def load_database(path: str, caching: bool = False) -> "TinyDBType":
     """
     Load a TinyDB database from the specified file path.
     
@@ -26,6 +27,9 @@ def load_database(path: str) -> "TinyDBType":
     Args:
         path: Path to the TinyDB JSON database file. The file will be created if it
               doesn't exist.
+        caching: If True, wrap the storage in TinyDB's CachingMiddleware so the file
+                 is parsed once and kept in memory. Intended for read-only handles
+                 that are reused across operations. Default is False.
         
     Returns:
         A TinyDB database instance that can be used for database operations.
@@ -44,7 +48,8 @@ def load_database(path: str) -> "TinyDBType":
     try:
         # Create TinyDB instance with JSON storage
         # TinyDB will automatically create the file if it doesn't exist
-        db = TinyDB(path, storage=JSONStorage)
+        storage = CachingMiddleware(JSONStorage) if caching else JSONStorage
+        db = TinyDB(path, storage=storage)
         return db
     except FileNotFoundError as e:
         # Handle case where the directory doesn't exist
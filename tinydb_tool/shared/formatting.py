@@ -6,7 +6,7 @@ in a user-friendly way.
 """
 
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 
 
 def format_documents(documents: List[Dict[str, Any]], pretty: bool = True) -> str:
@@ -40,3 +40,36 @@ def print_documents(documents: List[Dict[str, Any]], pretty: bool = True) -> Non
     formatted_output = format_documents(documents, pretty)
     print(formatted_output)
 
+
+def print_documents_stream(documents: Iterable[Dict[str, Any]], pretty: bool = True) -> None:
+    """
+    Print documents one at a time as they are produced.
+    
+    The output is identical to print_documents, but only one document is held
+    in memory at a time. If producing the documents raises, the exception
+    propagates and the JSON list printed so far is left unterminated, so the
+    partial output cannot be mistaken for a complete result.
+    
+    Args:
+        documents: An iterable of document dictionaries from TinyDB.
+        pretty: If True, format JSON with indentation. If False, use compact format.
+    """
+    if pretty:
+        # Nested lines of each document are indented one level for the list
+        opening, separator, closing = '[\n  ', ',\n  ', '\n]'
+    else:
+        opening, separator, closing = '[', ', ', ']'
+    
+    found = False
+    for document in documents:
+        if pretty:
+            formatted_document = json.dumps(document, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+        else:
+            formatted_document = json.dumps(document, ensure_ascii=False)
+        print((separator if found else opening) + formatted_document, end='')
+        found = True
+    
+    if found:
+        print(closing)
+    else:
+        print("No documents found in the database.")
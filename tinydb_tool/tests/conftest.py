@@ -0,0 +1,38 @@
+import os
+import tempfile
+
+import pytest
+
+from tinydb import TinyDB
+from tinydb_tool.commands.query_cmd import close_cached_databases
+
+
+@pytest.fixture
+def db_paths(request):
+    """
+    Create a temporary database file for each list of documents in request.param.
+
+    Use with indirect parametrization, e.g.
+    @pytest.mark.parametrize('db_paths', [[docs]], indirect=True).
+    """
+    paths = []
+    for documents in request.param:
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            paths.append(f.name)
+
+        db = TinyDB(paths[-1])
+        db.insert_multiple(documents)
+        db.close()
+
+    yield paths
+
+    close_cached_databases()
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@pytest.fixture
+def db_path(db_paths):
+    """The first database file created by db_paths."""
+    return db_paths[0]
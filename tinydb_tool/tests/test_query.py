@@ -0,0 +1,352 @@
+import json
+import math
+import operator
+import os
+import pytest
+from tinydb_tool.commands import query_cmd
+from tinydb_tool.commands.delete_cmd import execute_delete_command
+from tinydb_tool.commands.query_cmd import (
+    close_cached_databases, execute_query_command, is_numeric_value, parse_and_build_query,
+    parse_numeric_value, parse_query_string
+)
+from tinydb_tool.commands.update_cmd import execute_update_command
+from tinydb_tool.shared.formatting import print_documents, print_documents_stream
+
+
+def run_query(capsys, db_path, string_to_query):
+    """Run the query command and return the matching documents it printed."""
+    assert execute_query_command(db_path, string_to_query, pretty=False) == 0
+    output = capsys.readouterr().out.strip()
+    if output == 'No documents found in the database.':
+        return []
+    return json.loads(output)
+
+
+class TestPrintDocumentsStream:
+    @pytest.mark.parametrize('pretty', [True, False])
+    @pytest.mark.parametrize('documents', [
+        [],
+        [{'name': 'Alice'}],
+        [
+            {'name': 'Alice', 'tags': ['a', {'nested': [1, 2.5, None]}], 'meta': {}},
+            {'name': 'Zoë', 'note': 'line 1\nline 2', 'empty': []},
+            {}
+        ]
+    ])
+    def test_matches_print_documents(self, capsys, documents, pretty):
+        print_documents(documents, pretty)
+        expected = capsys.readouterr().out
+
+        print_documents_stream(iter(documents), pretty)
+
+        assert capsys.readouterr().out == expected
+
+    @pytest.mark.parametrize('pretty', [True, False])
+    @pytest.mark.parametrize('count', [0, 2])
+    def test_failure_leaves_list_unterminated(self, capsys, pretty, count):
+        documents = [{'name': 'Alice'}, {'name': 'Bob'}][:count]
+
+        def failing_documents():
+            yield from documents
+            raise RuntimeError('read failed')
+
+        with pytest.raises(RuntimeError):
+            print_documents_stream(failing_documents(), pretty)
+
+        output = capsys.readouterr().out
+        if documents:
+            assert output.startswith('[') and not output.rstrip().endswith(']')
+            with pytest.raises(json.JSONDecodeError):
+                json.loads(output)
+        else:
+            assert output == ''
+
+
+class TestParseQueryString:
+    @pytest.mark.parametrize('query, expected', [
+        ('age > 30', ('age', '>', '30')),
+        ('age>=30', ('age', '>=', '30')),
+        ("  name == 'Bob'  ", ('name', '==', 'Bob')),
+        ('a >> 3', ('a', '>', '> 3')),
+        ('a == =3', ('a', '==', '=3')),
+        # The two-character operator would leave no value, so '>' is used
+        ('a >=', ('a', '>', '=')),
+        ('a <=', ('a', '<', '=')),
+        # A lone quote is stripped like a quoted value
+        ('a == "', ('a', '==', '')),
+    ])
+    def test_valid(self, query, expected):
+        assert parse_query_string(query) == expected
+
+    @pytest.mark.parametrize('query', [
+        '',
+        '   ',
+        'bad',
+        'a == ',
+        'a = 1',
+        '== 1',
+        'a == b\nc',
+        'a ==\n"b"\nc',
+        None,
+    ])
+    def test_invalid(self, query):
+        assert parse_query_string(query) is None
+
+
+class TestParseQuery:
+    @pytest.mark.parametrize('query, message', [
+        (None, 'empty or non-string'),
+        ('', 'empty or non-string'),
+        ('   ', 'whitespace only'),
+        ('bad', 'Invalid query format'),
+        ('age > old', 'require numeric values'),
+    ])
+    def test_errors(self, query, message):
+        with pytest.raises(ValueError, match=message):
+            query_cmd._parse_query(query)
+
+    def test_numeric_value_is_parsed_once(self):
+        field_name, operator, value = query_cmd._parse_query('age < math.pi')
+
+        assert (field_name, operator) == ('age', '<')
+        assert isinstance(value, float)
+
+
+class TestParseAndBuildQuery:
+    def test_repeated_query_reuses_condition(self):
+        condition = parse_and_build_query('age >= 30')
+
+        assert parse_and_build_query('age >= 30') is condition
+        assert parse_and_build_query('age >= 31') is not condition
+        assert condition({'age': 30}) and not condition({'age': 29})
+
+    def test_cached_by_stripped_query(self):
+        assert parse_and_build_query('  age > 3 ') is parse_and_build_query('age > 3')
+
+    @pytest.mark.parametrize('query', ['bad', 'age > old', '   ', None, [], ['a'], {}])
+    def test_invalid_query_raises_every_time(self, query):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                parse_and_build_query(query)
+
+
+class TestParseNumericValue:
+    def test_expressions_only_when_allowed(self):
+        with pytest.raises(ValueError, match='Cannot parse as numeric value'):
+            parse_numeric_value('math.pi')
+
+        assert parse_numeric_value('math.pi', allow_expressions=True) == math.pi
+        assert parse_numeric_value(' 2.5 ') == 2.5
+
+
+class TestIsNumericValue:
+    @pytest.mark.parametrize('value', [0, -3, 2.5, True, math.inf, math.nan, ' 7 ', '1e400', 'nan'])
+    def test_numeric(self, value):
+        assert is_numeric_value(value)
+
+    def test_integer_too_large_for_float(self):
+        # JSON integers are numbers even when float() would overflow
+        assert is_numeric_value(10 ** 400)
+
+    @pytest.mark.parametrize('value', ['x', '', 'math.pi', None, [1], {}])
+    def test_not_numeric(self, value):
+        assert not is_numeric_value(value)
+
+
+EXPRESSION_DOCS = [{'a': 'math.pi'}, {'a': '2 * 3'}, {'a': 3}, {'a': '4'}]
+
+
+@pytest.mark.parametrize('db_paths', [[EXPRESSION_DOCS]], indirect=True)
+class TestNumericExpressions:
+    def test_document_values_are_not_evaluated(self, capsys, db_path):
+        assert run_query(capsys, db_path, 'a > 1') == [{'a': 3}, {'a': '4'}]
+
+    def test_query_value_is_evaluated(self, capsys, db_path):
+        assert run_query(capsys, db_path, 'a < math.pi') == [{'a': 3}]
+        assert run_query(capsys, db_path, 'a >= 2 * 2') == [{'a': '4'}]
+
+
+class TestCompileNumericTest:
+    operators = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le}
+    values = [
+        0, 1, -1, 1.5, 2 ** 53 + 1, 10 ** 400, -10 ** 400, True,
+        math.inf, -math.inf, math.nan, '1.5', ' 2 ', '1e400', 'nan', 'x', '', None, [1], {}
+    ]
+
+    def reference(self, operator_name, target, value):
+        compare = self.operators[operator_name]
+        if type(value) in (int, float):
+            return compare(value, target)
+        try:
+            return compare(float(value), target)
+        except (TypeError, ValueError, OverflowError):
+            return False
+
+    @pytest.mark.parametrize('operator_name', ['>', '>=', '<', '<='])
+    @pytest.mark.parametrize('target', [0.0, 1.5, -1.0, 1e300, 2 ** 53 + 1, math.inf, -math.inf, math.nan])
+    def test_matches_reference(self, operator_name, target):
+        test = query_cmd._compile_numeric_test(operator_name, target)
+
+        for value in self.values:
+            assert test(value) == self.reference(operator_name, target, value), value
+
+    def test_finite_target_is_inlined(self):
+        test = query_cmd._compile_numeric_test('>', 1.5)
+
+        assert 1.5 in test.__code__.co_consts
+
+    def test_rejects_unknown_operator(self):
+        with pytest.raises(ValueError, match='Unsupported operator'):
+            query_cmd._compile_numeric_test('==', 1.0)
+
+
+EQUALITY_DOCS = [
+    {'name': 'Alice', 'tags': ['a', 'b']},
+    {'name': 'Bob', 'tags': 'a'},
+    {'city': 'Chicago'},
+    {'name': 'Bob', 'tags': {'a': 1}}
+]
+
+
+@pytest.mark.parametrize('db_paths', [[EQUALITY_DOCS]], indirect=True)
+class TestEqualityIndex:
+    def test_matches_in_database_order(self, capsys, db_path):
+        assert run_query(capsys, db_path, 'name == Bob') == [EQUALITY_DOCS[1], EQUALITY_DOCS[3]]
+        assert run_query(capsys, db_path, 'name == Carol') == []
+
+    def test_missing_field_never_matches(self, capsys, db_path):
+        assert run_query(capsys, db_path, 'city == Chicago') == [EQUALITY_DOCS[2]]
+        assert run_query(capsys, db_path, 'name != Alice') == [EQUALITY_DOCS[1], EQUALITY_DOCS[3]]
+
+    def test_unhashable_values_are_skipped(self, capsys, db_path):
+        assert run_query(capsys, db_path, 'tags == a') == [EQUALITY_DOCS[1]]
+
+    def test_index_stored_with_handle(self, capsys, db_path):
+        run_query(capsys, db_path, 'name == Bob')
+        run_query(capsys, db_path, 'tags == a')
+        db, indexes = query_cmd._get_cached_db(db_path)
+        documents = indexes[query_cmd._DOCUMENTS_KEY]
+        # The indexes refer to the shared documents instead of copies
+        assert indexes[('==', 'name')]['Bob'][1] is documents[3]
+        assert indexes[('==', 'tags')]['a'][0] is documents[1]
+
+        query_cmd._evict_cached_db(db_path)
+
+        assert query_cmd._get_cached_db(db_path)[1] == {}
+
+
+@pytest.mark.parametrize('db_paths', [[
+    [{'name': 'Alice', 'age': 30 + i}, {'name': 'Bob', 'age': 25 + i}] for i in range(3)
+]], indirect=True)
+class TestDatabaseHandleCache:
+    def cached_handle(self, db_path):
+        return query_cmd._db_cache[os.path.abspath(db_path)][1]
+
+    def test_reuses_handle(self, capsys, db_path):
+        run_query(capsys, db_path, 'name == Bob')
+        db = self.cached_handle(db_path)
+
+        assert run_query(capsys, db_path, 'age > 26') == [{'name': 'Alice', 'age': 30}]
+        assert self.cached_handle(db_path) is db
+
+    def test_reloads_after_update(self, capsys, db_path):
+        run_query(capsys, db_path, 'name == Bob')
+        db = self.cached_handle(db_path)
+
+        assert execute_update_command(db_path, 'name == Bob', '{"name": "Robert"}') == 0
+
+        assert run_query(capsys, db_path, 'name == Bob') == []
+        assert run_query(capsys, db_path, 'name == Robert') == [{'name': 'Robert', 'age': 25}]
+        assert self.cached_handle(db_path) is not db
+
+    def test_reloads_after_delete(self, capsys, db_path):
+        assert len(run_query(capsys, db_path, 'age > 0')) == 2
+
+        assert execute_delete_command(db_path, 'name == Alice') == 0
+
+        assert run_query(capsys, db_path, 'age > 0') == [{'name': 'Bob', 'age': 25}]
+
+    def test_evicts_least_recently_used(self, capsys, monkeypatch, db_paths):
+        monkeypatch.setattr(query_cmd, '_DB_CACHE_SIZE', 2)
+        first, second, third = db_paths
+        run_query(capsys, first, 'name == Bob')
+        run_query(capsys, second, 'name == Bob')
+        run_query(capsys, first, 'name == Alice')
+
+        run_query(capsys, third, 'name == Bob')
+
+        assert list(query_cmd._db_cache) == [os.path.abspath(first), os.path.abspath(third)]
+
+    def test_close_cached_databases(self, capsys, db_paths):
+        for db_path in db_paths:
+            run_query(capsys, db_path, 'name == Bob')
+        assert len(query_cmd._db_cache) == 3
+
+        close_cached_databases()
+
+        assert not query_cmd._db_cache
+
+
+BIG = 2 ** 53 + 1
+
+SORTED_DOCS = [
+    {'a': 1}, {'a': 2}, {'a': 2}, {'a': 3.0}, {'a': 3}, {'a': '2'},
+    {'a': 'x'}, {'a': None}, {'a': [2]}, {'b': 2}, {'a': True},
+    {'a': BIG}, {'a': -BIG}
+]
+
+
+@pytest.mark.parametrize('db_paths', [[SORTED_DOCS]], indirect=True)
+class TestSortedIndex:
+    @pytest.fixture(params=['sorted_index', 'scan'])
+    def search_method(self, request, monkeypatch):
+        """Answer numeric queries from the sorted index, or by scanning without NumPy."""
+        if request.param == 'sorted_index':
+            pytest.importorskip('numpy')
+        else:
+            monkeypatch.setattr(query_cmd, 'np', None)
+        return request.param
+
+    @pytest.mark.parametrize('string_to_query, expected', [
+        ('a > 2', [3, 4, 11]),
+        ('a >= 2', [1, 2, 3, 4, 5, 11]),
+        ('a < 2', [0, 10, 12]),
+        ('a <= 2', [0, 1, 2, 5, 10, 12]),
+        ('a > 3', [11]),
+        ('a >= 3', [3, 4, 11]),
+        ('a < 1', [12]),
+        ('a <= 1', [0, 10, 12]),
+    ])
+    def test_boundaries_with_duplicates(self, capsys, db_path, search_method, string_to_query, expected):
+        matches = run_query(capsys, db_path, string_to_query)
+
+        assert matches == [SORTED_DOCS[i] for i in expected]
+
+    @pytest.mark.parametrize('string_to_query, expected', [
+        ('a > 9007199254740992', [11]),
+        ('a >= 9007199254740993', [11]),
+        ('a < -9007199254740992', [12]),
+        ('a <= -9007199254740993', [12]),
+        # Targets equal to the stored integers, which a float cannot hold
+        ('a > 9007199254740993', []),
+        ('a < 9007199254740993', [0, 1, 2, 3, 4, 5, 10, 12]),
+        ('a < -9007199254740993', []),
+        ('a > -9007199254740993', [0, 1, 2, 3, 4, 5, 10, 11]),
+        ('a < inf', [0, 1, 2, 3, 4, 5, 10, 11, 12]),
+        ('a > nan', []),
+    ])
+    def test_exact_for_large_integers(self, capsys, db_path, search_method, string_to_query, expected):
+        matches = run_query(capsys, db_path, string_to_query)
+
+        assert matches == [SORTED_DOCS[i] for i in expected]
+
+    @pytest.mark.parametrize('operator', ['>', '>=', '<', '<='])
+    @pytest.mark.parametrize('target', ['-1', '1', '2', '2.5', '3', '9007199254740992', 'inf', '-inf'])
+    def test_matches_scan_without_numpy(self, capsys, monkeypatch, db_path, operator, target):
+        pytest.importorskip('numpy')
+        string_to_query = f'a {operator} {target}'
+        with_index = run_query(capsys, db_path, string_to_query)
+
+        monkeypatch.setattr(query_cmd, 'np', None)
+
+        assert run_query(capsys, db_path, string_to_query) == with_index